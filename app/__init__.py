@@ -18,6 +18,9 @@ def create_app():
     app.register_blueprint(public_bp)
     app.register_blueprint(admin_bp, url_prefix="/admin")
 
+    from .serving import init_serving
+    init_serving(app)
+
     @login_manager.user_loader
     def load_user(user_id: str):
         return db.session.get(User, int(user_id))
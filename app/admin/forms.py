@@ -1,6 +1,6 @@
 from datetime import date
 from flask_wtf import FlaskForm
-from wtforms import StringField, TextAreaField, SelectField, BooleanField, PasswordField, DateField, SelectMultipleField
+from wtforms import StringField, TextAreaField, SelectField, BooleanField, PasswordField, DateField, SelectMultipleField, HiddenField
 from wtforms.validators import DataRequired, Optional
 
 from ..models import Rank
@@ -25,6 +25,8 @@ class ProjectForm(FlaskForm):
     title = StringField("Title", validators=[DataRequired()])
     description = TextAreaField("Description", validators=[Optional()])
     status = SelectField("Status", choices=[("active", "active"), ("archived", "archived")], validators=[DataRequired()])
+    version_id = HiddenField()  # row version the edit started from
+    base = HiddenField()  # signed field values the edit started from (three-way merge)
 
 
 class TaskForm(FlaskForm):
@@ -46,6 +48,8 @@ class TaskForm(FlaskForm):
         ("high", "high"),
     ], validators=[DataRequired()])
     assignees = SelectMultipleField("Assignees", coerce=int, validators=[DataRequired()])
+    version_id = HiddenField()  # row version the edit started from
+    base = HiddenField()  # signed field values the edit started from (three-way merge)
 
 
 class AttachmentForm(FlaskForm):
@@ -1,5 +1,9 @@
+from datetime import date, datetime
+from itsdangerous import BadSignature, URLSafeSerializer
 from werkzeug.security import check_password_hash, generate_password_hash
-from flask import Blueprint, render_template, redirect, url_for, request, flash
+from sqlalchemy.orm.exc import StaleDataError
+from wtforms import DateField
+from flask import Blueprint, render_template, redirect, url_for, request, flash, abort, current_app
 from flask_login import login_user, logout_user, login_required, current_user
 
 from ..models import db, User, Project, Task, TaskComment, ProjectAttachment, Rank
@@ -14,6 +18,79 @@ def admin_required():
     return True
 
 
+# ---- EDIT CONFLICTS (optimistic locking + three-way merge) ----
+# Edit forms carry the row version and a signed snapshot of the values they
+# were loaded with ("base"). When the version is stale, the admin's values are
+# merged with the current row field by field against that base, so fields
+# only the other admin changed are kept and only fields both changed conflict.
+def base_serializer():
+    return URLSafeSerializer(current_app.config["SECRET_KEY"], salt="admin-edit-base")
+
+
+def submitted_version(form) -> int:
+    raw = form.version_id.raw_data
+    if not raw or not raw[0].strip().isdigit():
+        abort(400)
+    return int(raw[0])
+
+
+def submitted_base(form) -> dict:
+    raw = form.base.raw_data
+    if not raw or not raw[0]:
+        abort(400)
+    try:
+        return base_serializer().loads(raw[0])
+    except BadSignature:
+        abort(400)
+
+
+def three_way_merge(base, theirs, yours):
+    """Merge field values; returns (merged, keys changed differently on both sides)."""
+    merged, conflicts = {}, []
+    for key, mine in yours.items():
+        orig, current = base.get(key), theirs[key]
+        if mine == orig or mine == current:
+            merged[key] = current
+        elif current == orig:
+            merged[key] = mine
+        else:
+            merged[key] = mine
+            conflicts.append(key)
+    return merged, conflicts
+
+
+def display_value(field, value):
+    choices = dict(getattr(field, "choices", None) or [])
+    if isinstance(value, list):
+        return ", ".join(str(choices.get(v, f"#{v}")) for v in value)
+    return choices.get(value, value)
+
+
+def render_conflict(template, form, obj, merged, theirs, conflicts, **ctx):
+    rows = [
+        (form[key].label.text, display_value(form[key], theirs[key]), display_value(form[key], merged[key]))
+        for key in conflicts
+    ]
+    # Pre-fill the merged values and move the form onto the current version:
+    # saving again applies exactly what is shown.
+    for key, value in merged.items():
+        field = form[key]
+        field.data = date.fromisoformat(value) if isinstance(field, DateField) and value else value
+        field.raw_data = None
+    form.version_id.data = obj.version_id
+    form.base.data = base_serializer().dumps(theirs)
+
+    if rows:
+        flash("Someone else changed the fields below at the same time. Their other changes have been merged in; choose the values to keep and save again.", "warning")
+    else:
+        flash("Someone else saved this in the meantime. Their changes have been merged with yours; review and save again.", "warning")
+    return render_template(template, form=form, mode="edit", conflicts=rows, **ctx), 409
+
+
+def iso(d):
+    return d.isoformat() if d else None
+
+
 @bp.route("/")
 @login_required
 def index():
@@ -161,18 +238,51 @@ def project_edit(project_id):
         flash("Project not found.", "danger")
         return redirect(url_for("admin.projects"))
 
-    form = ProjectForm(title=p.title, description=p.description, status=p.status)
+    form = ProjectForm(
+        title=p.title,
+        description=p.description,
+        status=p.status,
+        version_id=p.version_id,
+        base=base_serializer().dumps(project_values(p)),
+    )
     if form.validate_on_submit():
-        p.title = form.title.data.strip()
-        p.description = form.description.data
-        p.status = form.status.data
-        db.session.commit()
-        flash("Project updated.", "success")
+        version = submitted_version(form)
+        base = submitted_base(form)
+        values = project_form_values(form)
+        was_stale = version != p.version_id
+        if was_stale:
+            values, conflicts = three_way_merge(base, project_values(p), values)
+            if conflicts:
+                return render_conflict("admin/project_form.html", form, p, values, project_values(p), conflicts)
+
+        p.title = values["title"]
+        p.description = values["description"]
+        p.status = values["status"]
+        p.updated_at = datetime.now()  # always UPDATE the row so the version is checked
+        try:
+            db.session.commit()
+        except StaleDataError:
+            db.session.rollback()
+            merged, conflicts = three_way_merge(base, project_values(p), project_form_values(form))
+            return render_conflict("admin/project_form.html", form, p, merged, project_values(p), conflicts)
+        flash("Project updated (merged with changes saved by someone else)." if was_stale else "Project updated.", "success")
         return redirect(url_for("admin.projects"))
 
     return render_template("admin/project_form.html", form=form, mode="edit")
 
 
+def project_values(p):
+    return {"title": p.title, "description": p.description or "", "status": p.status}
+
+
+def project_form_values(form):
+    return {
+        "title": form.title.data.strip(),
+        "description": form.description.data or "",
+        "status": form.status.data,
+    }
+
+
 # ---- TASKS ----
 @bp.route("/tasks")
 @login_required
@@ -246,6 +356,8 @@ def task_edit(task_id):
         status=t.status,
         priority=t.priority,
         assignees=[u.id for u in t.assignees],
+        version_id=t.version_id,
+        base=base_serializer().dumps(task_values(t)),
     )
 
     projects = Project.query.order_by(Project.title).all()
@@ -258,24 +370,66 @@ def task_edit(task_id):
         if not form.assignees.data:
             flash("Task must have at least one assignee.", "danger")
             return render_template("admin/task_form.html", form=form, mode="edit", task=t)
-
-        t.project_id = form.project_id.data
-        t.title = form.title.data.strip()
-        t.description = form.description.data
-        t.assign_date = form.assign_date.data
-        t.deadline = form.deadline.data
-        t.delivery_date = form.delivery_date.data
-        t.status = form.status.data
-        t.priority = form.priority.data
-        t.assignees = [db.session.get(User, uid) for uid in form.assignees.data]
-
-        db.session.commit()
-        flash("Task updated.", "success")
+        version = submitted_version(form)
+        base = submitted_base(form)
+        values = task_form_values(form)
+        was_stale = version != t.version_id
+        if was_stale:
+            values, conflicts = three_way_merge(base, task_values(t), values)
+            if conflicts:
+                return render_conflict("admin/task_form.html", form, t, values, task_values(t), conflicts, task=t)
+
+        t.project_id = values["project_id"]
+        t.title = values["title"]
+        t.description = values["description"]
+        t.assign_date = values["assign_date"] and date.fromisoformat(values["assign_date"])
+        t.deadline = values["deadline"] and date.fromisoformat(values["deadline"])
+        t.delivery_date = values["delivery_date"] and date.fromisoformat(values["delivery_date"])
+        t.status = values["status"]
+        t.priority = values["priority"]
+        t.assignees = [db.session.get(User, uid) for uid in values["assignees"]]
+        t.updated_at = datetime.now()  # always UPDATE the row so assignee-only edits are version-checked too
+
+        try:
+            db.session.commit()
+        except StaleDataError:
+            db.session.rollback()
+            merged, conflicts = three_way_merge(base, task_values(t), task_form_values(form))
+            return render_conflict("admin/task_form.html", form, t, merged, task_values(t), conflicts, task=t)
+        flash("Task updated (merged with changes saved by someone else)." if was_stale else "Task updated.", "success")
         return redirect(url_for("admin.tasks"))
 
     return render_template("admin/task_form.html", form=form, mode="edit", task=t)
 
 
+def task_values(t):
+    return {
+        "project_id": t.project_id,
+        "title": t.title,
+        "description": t.description or "",
+        "assign_date": iso(t.assign_date),
+        "deadline": iso(t.deadline),
+        "delivery_date": iso(t.delivery_date),
+        "status": t.status,
+        "priority": t.priority,
+        "assignees": sorted(u.id for u in t.assignees),
+    }
+
+
+def task_form_values(form):
+    return {
+        "project_id": form.project_id.data,
+        "title": form.title.data.strip(),
+        "description": form.description.data or "",
+        "assign_date": iso(form.assign_date.data),
+        "deadline": iso(form.deadline.data),
+        "delivery_date": iso(form.delivery_date.data),
+        "status": form.status.data,
+        "priority": form.priority.data,
+        "assignees": sorted(form.assignees.data),
+    }
+
+
 # ---- ATTACHMENTS (Project links) ----
 @bp.route("/projects/<int:project_id>/attachments")
 @login_required
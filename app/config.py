@@ -11,4 +11,29 @@ class Config:
 
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
-    PUBLIC_READONLY = True
\ No newline at end of file
+    PUBLIC_READONLY = True
+
+    # Deadline reminders (send_reminders.py)
+    REMINDER_DAYS_AHEAD = int(os.getenv("REMINDER_DAYS_AHEAD", "3"))
+    REMINDER_SINK = os.getenv("REMINDER_SINK", "file")  # file / maildir / stdout
+    REMINDER_OUTPUT_DIR = os.getenv("REMINDER_OUTPUT_DIR", "reminders")
+    REMINDER_BATCH_SIZE = int(os.getenv("REMINDER_BATCH_SIZE", "1000"))
+    REMINDER_MAIL_FROM = os.getenv("REMINDER_MAIL_FROM", "office-tasks@intranet.local")
+
+    # Serving (serve.py / wsgi.py)
+    SERVE_HOST = os.getenv("SERVE_HOST", "0.0.0.0")
+    SERVE_PORT = int(os.getenv("SERVE_PORT", "8080"))
+    SERVE_THREADS = int(os.getenv("SERVE_THREADS", "8"))
+    SERVE_CONNECTION_LIMIT = int(os.getenv("SERVE_CONNECTION_LIMIT", "200"))
+    SERVE_CHANNEL_TIMEOUT = int(os.getenv("SERVE_CHANNEL_TIMEOUT", "60"))
+    SERVE_WORKERS = int(os.getenv("SERVE_WORKERS", "0"))  # pre-fork only; 0 = one per CPU core
+
+    # Serve app/static without going through Flask routing (disable if IIS / nginx serves it)
+    SERVE_STATIC_OFFLOAD = os.getenv("SERVE_STATIC_OFFLOAD", "1") == "1"
+    STATIC_MAX_AGE = int(os.getenv("STATIC_MAX_AGE", "86400"))
+
+    # gzip / brotli (if installed) for HTML responses
+    COMPRESS_RESPONSES = os.getenv("COMPRESS_RESPONSES", "1") == "1"
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "500"))
+    COMPRESS_GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", "6"))
+    COMPRESS_BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", "5"))
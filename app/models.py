@@ -3,7 +3,7 @@ from __future__ import annotations
 import enum
 from datetime import datetime, date
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Enum, Table, Column, Integer, ForeignKey
+from sqlalchemy import Enum, Table, Column, Integer, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 db = SQLAlchemy()
@@ -29,6 +29,8 @@ task_assignees = Table(
     db.metadata,
     Column("task_id", Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True),
     Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    # PK is (task_id, user_id); reminders look tasks up by user
+    Index("ix_task_assignees_user_id", "user_id"),
 )
 
 
@@ -88,12 +90,20 @@ class Project(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
 
+    # optimistic locking: UPDATEs check and bump this, see admin.routes.project_edit
+    version_id = db.Column(db.Integer, nullable=False, server_default="1")
+    __mapper_args__ = {"version_id_col": version_id}
+
     tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
     attachments = relationship("ProjectAttachment", back_populates="project", cascade="all, delete-orphan")
 
 
 class Task(db.Model):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # open tasks by deadline (reminders, overdue filters)
+        Index("ix_tasks_open_deadline", "deadline", postgresql_where=db.text("delivery_date IS NULL")),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
@@ -113,6 +123,10 @@ class Task(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
 
+    # optimistic locking: UPDATEs check and bump this, see admin.routes.task_edit
+    version_id = db.Column(db.Integer, nullable=False, server_default="1")
+    __mapper_args__ = {"version_id_col": version_id}
+
     assignees = relationship("User", secondary=task_assignees, backref="tasks")
     comments = relationship("TaskComment", back_populates="task", cascade="all, delete-orphan")
 
@@ -147,3 +161,22 @@ class ProjectAttachment(db.Model):
     path = db.Column(db.String(500), nullable=False)  # UNC path / file:/// / intranet URL
 
     created_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
+
+
+class ReminderLog(db.Model):
+    """One row per deadline digest sent, so reminder runs are idempotent per day."""
+    __tablename__ = "reminder_log"
+    __table_args__ = (
+        UniqueConstraint("user_id", "sent_on", name="uq_reminder_log_user_day"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user = relationship("User")
+
+    sent_on = db.Column(db.Date, nullable=False)
+    task_count = db.Column(db.Integer, nullable=False)
+    sink = db.Column(db.String(20), nullable=False)
+
+    created_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
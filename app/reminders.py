@@ -0,0 +1,205 @@
+"""Deadline reminder digests.
+
+Finds open tasks that are overdue or due within N days, groups them per
+assignee and delivers one digest per user to a sink. Each digest is claimed
+in ``reminder_log`` before delivery, so re-running on the same day (or two
+overlapping runs) never sends a user a second digest.
+"""
+from __future__ import annotations
+
+import mailbox
+import os
+from datetime import date, timedelta
+from email.message import EmailMessage
+from itertools import groupby
+
+from flask import current_app
+from sqlalchemy import select, exists
+from sqlalchemy.exc import IntegrityError
+
+from .models import db, User, Project, Task, ReminderLog, task_assignees
+
+
+# ---- SINKS ----
+class FileSink:
+    """One text file per digest: <output_dir>/<YYYY-MM-DD>/<user_id>.txt"""
+    name = "file"
+
+    def __init__(self, output_dir: str, mail_from: str):
+        self.output_dir = output_dir
+
+    def deliver(self, user_id: int, subject: str, body: str, sent_on: date) -> None:
+        day_dir = os.path.join(self.output_dir, sent_on.isoformat())
+        os.makedirs(day_dir, exist_ok=True)
+        path = os.path.join(day_dir, f"{user_id}.txt")
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(f"Subject: {subject}\n\n{body}")
+        os.replace(tmp, path)
+
+    def close(self) -> None:
+        pass
+
+
+class MaildirSink:
+    """Local Maildir, readable by any mail client (stand-in for SMTP)."""
+    name = "maildir"
+
+    def __init__(self, output_dir: str, mail_from: str):
+        self.mail_from = mail_from
+        self.box = mailbox.Maildir(output_dir, create=True)
+
+    def deliver(self, user_id: int, subject: str, body: str, sent_on: date) -> None:
+        msg = EmailMessage()
+        msg["From"] = self.mail_from
+        msg["To"] = f"user-{user_id}"
+        msg["Subject"] = subject
+        msg.set_content(body)
+        self.box.add(msg)
+
+    def close(self) -> None:
+        self.box.close()
+
+
+class StdoutSink:
+    name = "stdout"
+
+    def __init__(self, output_dir: str, mail_from: str):
+        pass
+
+    def deliver(self, user_id: int, subject: str, body: str, sent_on: date) -> None:
+        print(f"=== user {user_id}: {subject}\n{body}")
+
+    def close(self) -> None:
+        pass
+
+
+SINKS = {
+    "file": FileSink,
+    "maildir": MaildirSink,
+    "stdout": StdoutSink,
+}
+
+
+def get_sink(name: str, output_dir: str, mail_from: str):
+    try:
+        sink_cls = SINKS[name]
+    except KeyError:
+        raise ValueError(f"Unknown reminder sink: {name} (choose from {', '.join(SINKS)})")
+    return sink_cls(output_dir, mail_from)
+
+
+# ---- QUERY ----
+def due_tasks_query(today: date, days_ahead: int):
+    """Open tasks due up to today + days_ahead (incl. overdue), one row per (assignee, task).
+
+    Rows are ordered by user so they can be grouped in a single streaming pass.
+    Users that already got today's digest are excluded.
+    """
+    horizon = today + timedelta(days=days_ahead)
+    already_sent = exists().where(
+        ReminderLog.user_id == task_assignees.c.user_id,
+        ReminderLog.sent_on == today,
+    )
+    return (
+        select(
+            task_assignees.c.user_id,
+            User.last_name,
+            User.first_name,
+            Task.id.label("task_id"),
+            Task.title,
+            Task.deadline,
+            Task.status,
+            Task.priority,
+            Project.title.label("project_title"),
+        )
+        .select_from(task_assignees)
+        .join(Task, Task.id == task_assignees.c.task_id)
+        .join(User, User.id == task_assignees.c.user_id)
+        .join(Project, Project.id == Task.project_id)
+        .where(
+            Task.deadline.isnot(None),
+            Task.delivery_date.is_(None),
+            Task.deadline <= horizon,
+            User.active.is_(True),
+            ~already_sent,
+        )
+        .order_by(task_assignees.c.user_id, Task.deadline, Task.id)
+    )
+
+
+# ---- SENT-LOG ----
+def claim_digest(user_id: int, sent_on: date, task_count: int, sink_name: str) -> ReminderLog | None:
+    """Record today's digest for user_id *before* delivering it.
+
+    Returns None if the slot is already taken. Claiming first means a crash
+    between claim and delivery skips that digest rather than sending it twice.
+    """
+    log = ReminderLog(user_id=user_id, sent_on=sent_on, task_count=task_count, sink=sink_name)
+    db.session.add(log)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return None
+    return log
+
+
+def release_digest(log: ReminderLog) -> None:
+    """Undo a claim whose delivery failed, so the next run retries it."""
+    db.session.delete(log)
+    db.session.commit()
+
+
+# ---- RUN ----
+def send_reminders(today: date | None = None, days_ahead: int | None = None,
+                   sink_name: str | None = None, output_dir: str | None = None,
+                   dry_run: bool = False) -> dict:
+    """Send one digest per assignee. Must run inside an app context."""
+    cfg = current_app.config
+    today = today or date.today()
+    days_ahead = cfg["REMINDER_DAYS_AHEAD"] if days_ahead is None else days_ahead
+    sink_name = "stdout" if dry_run else (sink_name or cfg["REMINDER_SINK"])
+    sink = get_sink(sink_name, output_dir or cfg["REMINDER_OUTPUT_DIR"], cfg["REMINDER_MAIL_FROM"])
+    template = current_app.jinja_env.get_template("reminders/digest.txt")
+
+    stats = {"users": 0, "tasks": 0, "skipped": 0}
+    stmt = due_tasks_query(today, days_ahead)
+    try:
+        # Stream on a dedicated connection so per-digest commits to the
+        # sent-log (via db.session) don't close the server-side cursor.
+        with db.engine.connect() as conn:
+            rows = conn.execution_options(yield_per=cfg["REMINDER_BATCH_SIZE"]).execute(stmt)
+            for user_id, user_rows in groupby(rows, key=lambda r: r.user_id):
+                user_rows = list(user_rows)
+                overdue = [r for r in user_rows if r.deadline < today]
+                upcoming = [r for r in user_rows if r.deadline >= today]
+                first = user_rows[0]
+
+                subject = f"Office Tasks: {len(overdue)} overdue, {len(upcoming)} due soon"
+                body = template.render(
+                    name=f"{first.last_name} {first.first_name}",
+                    today=today,
+                    days_ahead=days_ahead,
+                    overdue=overdue,
+                    upcoming=upcoming,
+                )
+                if not dry_run:
+                    claim = claim_digest(user_id, today, len(user_rows), sink_name)
+                    if claim is None:
+                        # another run got here first (overlapping cron jobs)
+                        stats["skipped"] += 1
+                        continue
+                    try:
+                        sink.deliver(user_id, subject, body, today)
+                    except Exception:
+                        release_digest(claim)
+                        raise
+                else:
+                    sink.deliver(user_id, subject, body, today)
+
+                stats["users"] += 1
+                stats["tasks"] += len(user_rows)
+    finally:
+        sink.close()
+    return stats
@@ -0,0 +1,55 @@
+"""Production serving helpers: static offload and HTML compression."""
+from __future__ import annotations
+
+import gzip
+
+from flask import current_app, request
+from werkzeug.middleware.shared_data import SharedDataMiddleware
+
+try:
+    import brotli  # optional: pip install brotli
+except ImportError:
+    brotli = None
+
+
+def init_serving(app):
+    cfg = app.config
+
+    if cfg["SERVE_STATIC_OFFLOAD"] and app.static_folder:
+        # Static files are answered by the middleware before Flask sets up a
+        # request/app context, so they skip routing, sessions and hooks.
+        app.wsgi_app = SharedDataMiddleware(
+            app.wsgi_app,
+            {app.static_url_path: app.static_folder},
+            cache_timeout=cfg["STATIC_MAX_AGE"],
+        )
+
+    if cfg["COMPRESS_RESPONSES"]:
+        app.after_request(compress_response)
+
+
+def compress_response(response):
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code in (204, 206, 304)
+        or response.mimetype != "text/html"
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    data = response.get_data()
+    cfg = current_app.config
+    if len(data) < cfg["COMPRESS_MIN_SIZE"]:
+        return response
+
+    accepted = request.accept_encodings
+    if brotli is not None and accepted["br"]:
+        response.set_data(brotli.compress(data, quality=cfg["COMPRESS_BROTLI_QUALITY"]))
+        response.headers["Content-Encoding"] = "br"
+    elif accepted["gzip"]:
+        response.set_data(gzip.compress(data, compresslevel=cfg["COMPRESS_GZIP_LEVEL"]))
+        response.headers["Content-Encoding"] = "gzip"
+    return response
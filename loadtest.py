@@ -0,0 +1,109 @@
+"""Throughput load test for serve.py.
+
+Starts the server once per worker count, hammers one URL from several client
+processes for a fixed duration and prints requests/second, e.g.
+
+    python loadtest.py --workers 1 2 4 --path /tasks
+    python loadtest.py --url http://127.0.0.1:8080/   # measure an already running server
+
+Uses only the standard library. Run it on the server box against a database
+with realistic data; client processes compete for the same cores, so leave
+some headroom (--clients defaults to 2x CPU cores).
+"""
+import argparse
+import http.client
+import os
+import subprocess
+import sys
+import time
+from multiprocessing import Pool
+from urllib.parse import urlsplit
+
+SERVE_PY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "serve.py")
+
+
+def _client(args):
+    host, port, path, duration = args
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    ok = errors = 0
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        try:
+            conn.request("GET", path, headers={"Accept-Encoding": "gzip, br"})
+            resp = conn.getresponse()
+            resp.read()
+            if resp.status == 200:
+                ok += 1
+            else:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+    conn.close()
+    return ok, errors
+
+
+def measure(host, port, path, clients, duration):
+    with Pool(clients) as pool:
+        results = pool.map(_client, [(host, port, path, duration)] * clients)
+    ok = sum(r[0] for r in results)
+    errors = sum(r[1] for r in results)
+    return ok / duration, errors
+
+
+def wait_until_up(server, host, port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f"serve.py exited with code {server.returncode} before accepting connections")
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=1)
+            conn.request("GET", "/static/app.css")
+            conn.getresponse().read()
+            conn.close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise SystemExit(f"server on {host}:{port} did not come up")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure serve.py throughput across worker counts.")
+    parser.add_argument("--url", help="measure this already running server instead of starting serve.py")
+    parser.add_argument("--path", default="/", help="path to request (default: /)")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="pre-fork worker counts to try")
+    parser.add_argument("--threads", type=int, default=4, help="threads per worker")
+    parser.add_argument("--clients", type=int, default=2 * (os.cpu_count() or 1))
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per measurement")
+    args = parser.parse_args()
+
+    if args.url:
+        parts = urlsplit(args.url)
+        rps, errors = measure(parts.hostname, parts.port or 80, parts.path or "/", args.clients, args.duration)
+        print(f"{rps:10.1f} req/s  ({errors} errors)")
+        return
+
+    host = "127.0.0.1"
+    baseline = None
+    print(f"{'workers':>8} {'req/s':>10} {'speedup':>8} {'errors':>7}")
+    for workers in args.workers:
+        server = subprocess.Popen([
+            sys.executable, SERVE_PY, "--prefork",
+            "--host", host, "--port", str(args.port),
+            "--workers", str(workers), "--threads", str(args.threads),
+        ])
+        try:
+            wait_until_up(server, host, args.port)
+            rps, errors = measure(host, args.port, args.path, args.clients, args.duration)
+        finally:
+            server.terminate()
+            server.wait()
+        baseline = baseline or rps
+        speedup = rps / baseline if baseline else 0.0
+        print(f"{workers:>8} {rps:>10.1f} {speedup:>7.2f}x {errors:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Deadline reminder digests (cron-friendly, safe to re-run the same day).
+
+Example crontab entry:
+    0 7 * * 1-5  cd /srv/office_tasks && venv/bin/python send_reminders.py
+"""
+import argparse
+from datetime import date
+
+from app import create_app
+from app.reminders import send_reminders, SINKS
+
+def main():
+    parser = argparse.ArgumentParser(description="Send overdue / upcoming deadline digests to assignees.")
+    parser.add_argument("--days", type=int, help="look-ahead window in days (default: REMINDER_DAYS_AHEAD)")
+    parser.add_argument("--sink", choices=sorted(SINKS), help="delivery sink (default: REMINDER_SINK)")
+    parser.add_argument("--output-dir", help="directory for file/maildir sinks (default: REMINDER_OUTPUT_DIR)")
+    parser.add_argument("--date", type=date.fromisoformat, help="run as if today were YYYY-MM-DD")
+    parser.add_argument("--dry-run", action="store_true", help="print digests, don't record them as sent")
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        stats = send_reminders(
+            today=args.date,
+            days_ahead=args.days,
+            sink_name=args.sink,
+            output_dir=args.output_dir,
+            dry_run=args.dry_run,
+        )
+        print(f"Sent {stats['users']} digest(s) covering {stats['tasks']} task assignment(s)"
+              f", skipped {stats['skipped']} already claimed by another run")
+
+if __name__ == "__main__":
+    main()
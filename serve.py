@@ -0,0 +1,94 @@
+"""Production entry point.
+
+    python serve.py                 # waitress, threaded (Windows / Linux)
+    python serve.py --prefork       # gunicorn pre-fork workers (Linux only)
+
+All tuning comes from Config (SERVE_* environment variables); command line
+flags override it for one-off runs and load tests.
+"""
+import argparse
+import os
+
+from app import create_app
+from app.models import db
+
+
+def serve_waitress(app, host, port, threads):
+    from waitress import serve
+
+    cfg = app.config
+    serve(
+        app,
+        host=host,
+        port=port,
+        threads=threads,
+        connection_limit=cfg["SERVE_CONNECTION_LIMIT"],
+        channel_timeout=cfg["SERVE_CHANNEL_TIMEOUT"],
+        ident="office-tasks",
+    )
+
+
+def serve_prefork(app, host, port, threads, workers):
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise SystemExit("--prefork needs gunicorn (Linux only): pip install gunicorn")
+
+    def post_fork(server, worker):
+        # The app is loaded once in the master; drop any pooled connections
+        # inherited through fork() so workers never share a socket.
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose(close=False)
+
+    cfg = app.config
+    workers = workers or os.cpu_count() or 1
+    options = {
+        "bind": f"{host}:{port}",
+        "workers": workers,
+        "worker_class": "gthread",
+        "threads": threads,
+        # gunicorn caps connections per worker; split the total so
+        # SERVE_CONNECTION_LIMIT means the same as under waitress
+        "worker_connections": max(1, -(-cfg["SERVE_CONNECTION_LIMIT"] // workers)),
+        # idle keep-alive connections are closed after this many seconds
+        "keepalive": cfg["SERVE_CHANNEL_TIMEOUT"],
+        "preload_app": True,
+        "post_fork": post_fork,
+    }
+
+    class OfficeTasksApplication(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    OfficeTasksApplication().run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Office Tasks in production.")
+    parser.add_argument("--host", help="bind address (default: SERVE_HOST)")
+    parser.add_argument("--port", type=int, help="bind port (default: SERVE_PORT)")
+    parser.add_argument("--threads", type=int, help="threads per process (default: SERVE_THREADS)")
+    parser.add_argument("--prefork", action="store_true", help="run gunicorn pre-fork workers instead of waitress")
+    parser.add_argument("--workers", type=int, help="pre-fork worker processes (default: SERVE_WORKERS, 0 = CPU cores)")
+    args = parser.parse_args()
+
+    app = create_app()
+    cfg = app.config
+    host = args.host or cfg["SERVE_HOST"]
+    port = args.port or cfg["SERVE_PORT"]
+    threads = args.threads or cfg["SERVE_THREADS"]
+
+    if args.prefork:
+        workers = cfg["SERVE_WORKERS"] if args.workers is None else args.workers
+        serve_prefork(app, host, port, threads, workers)
+    else:
+        serve_waitress(app, host, port, threads)
+
+
+if __name__ == "__main__":
+    main()